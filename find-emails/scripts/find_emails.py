@@ -2,13 +2,47 @@
 """Crawl websites locally via crawl4ai and extract contact emails from relevant pages."""
 import argparse
 import asyncio
+import functools
 import json
 import re
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TextIO
 from urllib.parse import urlparse
 
-EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pages are scanned as str: CPython already stores ASCII text one byte per char,
+# so encoding to bytes first only adds a copy (slower on pages with non-ASCII).
+# re and google-re2 compile the same pattern so results never depend on which is
+# installed; no anchors or lookarounds, which would change what findall returns.
+EMAIL_PATTERN = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
+EMAIL_REGEX = re.compile(EMAIL_PATTERN, re.ASCII)
+
+
+def _email_scanner():
+    """Return the compiled email pattern, preferring google-re2 (linear-time DFA) when installed."""
+    try:
+        import re2
+    except ImportError:
+        return EMAIL_REGEX
+    try:
+        return re2.compile(EMAIL_PATTERN)
+    except re2.error:
+        return EMAIL_REGEX
+
+
+# Resolved once so the per-page scan loops skip the attribute lookup
+_SCANNER = _email_scanner()
+_FIND = _SCANNER.findall
+_FINDITER = _SCANNER.finditer
+
 
 # www. prefix stripped for canonical domain grouping (www.example.com === example.com)
 DOMAIN_WWW_PREFIX = re.compile(r"^www\.", re.IGNORECASE)
@@ -39,47 +73,136 @@ DEFAULT_URL_PATTERNS = [
 ]
 
 
+@functools.lru_cache(maxsize=8)
+def _load_url_patterns_cached(config_path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Parse url_patterns.json; keyed on mtime so edits to the file are picked up."""
+    data = json.loads(Path(config_path).read_text())
+    return tuple(data.get("url_patterns", DEFAULT_URL_PATTERNS))
+
+
 def load_url_patterns(script_dir: Path) -> list[str]:
     """Load URL filter patterns from url_patterns.json, or return defaults."""
     config_path = script_dir / "url_patterns.json"
-    if config_path.exists():
-        try:
-            data = json.loads(config_path.read_text())
-            return data.get("url_patterns", DEFAULT_URL_PATTERNS)
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        return DEFAULT_URL_PATTERNS
+    try:
+        return list(_load_url_patterns_cached(str(config_path), mtime_ns))
+    except (json.JSONDecodeError, OSError):
+        pass
     return DEFAULT_URL_PATTERNS
 
 
+def _accumulate(
+    text: str,
+    path: str,
+    combined: defaultdict[str, set[str]],
+    max_emails: int | None = None,
+) -> None:
+    """Add emails found in text to combined ({email_lower: {paths}}) in place.
+
+    With max_emails, scanning stops once that many unique emails were found in text.
+    """
+    # Cheap memchr-style rejection: most pages carry no '@' at all
+    if "@" not in text:
+        return
+    if not max_emails:
+        # Lowercase only the hits: lowering the whole page copies it and can fold
+        # non-ASCII characters (e.g. the Kelvin sign) into new ASCII matches
+        for key in map(str.lower, _FIND(text)):
+            combined[key].add(path)
+        return
+    seen: set[str] = set()
+    for match in _FINDITER(text):
+        key = match.group().lower()
+        combined[key].add(path)
+        seen.add(key)
+        if len(seen) >= max_emails:
+            break
+
+
+def _finalize(combined: dict[str, set[str]]) -> dict[str, list[str]]:
+    """Convert an accumulator into {email_lower: [paths]} with sorted paths."""
+    return {e: sorted(paths) for e, paths in combined.items()}
+
+
 def extract_emails_from_text(text: str, path: str) -> dict[str, list[str]]:
     """Extract emails from text and return {email_lower: [paths]}."""
-    email_sources: dict[str, set[str]] = {}
-    for email in EMAIL_REGEX.findall(text):
-        key = email.lower()
-        email_sources.setdefault(key, set()).add(path)
-    return {e: sorted(paths) for e, paths in email_sources.items()}
+    combined: defaultdict[str, set[str]] = defaultdict(set)
+    _accumulate(text, path, combined)
+    return _finalize(combined)
 
 
 def extract_from_file(file_path: Path) -> dict[str, dict[str, list[str]]]:
-    """Extract emails from a local markdown/text file. Returns {source: {email: [paths]}}."""
-    text = file_path.read_text()
-    path = str(file_path.name)
-    email_sources = extract_emails_from_text(text, path)
-    return {path: email_sources}
+    """Extract emails from a local markdown/text file. Returns {source: {email: [paths]}}.
 
-
-async def crawl_and_extract(
-    urls: list[str],
+    The source is the path as given, so same-named files in different directories
+    stay separate.
+    """
+    text = file_path.read_text()
+    path = str(file_path)
+    combined: defaultdict[str, set[str]] = defaultdict(set)
+    _accumulate(text, path, combined)
+    return {path: _finalize(combined)}
+
+
+def _merge(
+    src: dict[str, dict[str, list[str]]],
+    dest: dict[str, dict[str, list[str]]],
+) -> None:
+    """Merge {source: {email: [paths]}} results into dest, unioning paths for repeated sources."""
+    for source, emails in src.items():
+        target = dest.setdefault(source, {})
+        for email, paths in emails.items():
+            if email in target:
+                target[email] = sorted(set(target[email]).union(paths))
+            else:
+                target[email] = paths
+
+
+def extract_from_files(file_paths: list[Path]) -> dict[str, dict[str, list[str]]]:
+    """Extract emails from several local files, scanning them in parallel worker processes."""
+    if len(file_paths) == 1:
+        return extract_from_file(file_paths[0])
+    combined: dict[str, dict[str, list[str]]] = {}
+    # Regex scanning is CPU-bound; processes sidestep the GIL
+    with ProcessPoolExecutor() as executor:
+        for result in executor.map(extract_from_file, file_paths, chunksize=8):
+            _merge(result, combined)
+    return combined
+
+
+def _build_browser_config(verbose: bool):
+    """Build the BrowserConfig shared by one-shot and serve modes."""
+    from crawl4ai import BrowserConfig
+
+    return BrowserConfig(headless=True, verbose=verbose)
+
+
+def _build_run_config(
     url_patterns: list[str],
     max_depth: int,
     max_pages: int,
-    verbose: bool,
-) -> dict[str, dict[str, list[str]]]:
-    """Crawl URLs locally via crawl4ai and extract emails. Returns {domain: {email: [paths]}}."""
-    from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
+):
+    """Build a CrawlerRunConfig with a fresh deep-crawl strategy.
+
+    The strategy counts pages crawled on the instance and never resets the count,
+    so each independent crawl session needs its own config.
+    """
+    from crawl4ai import CrawlerRunConfig, CacheMode, MarkdownGenerationResult
     from crawl4ai.deep_crawling import BestFirstCrawlingStrategy
     from crawl4ai.deep_crawling.filters import FilterChain, URLPatternFilter
     from crawl4ai.deep_crawling.scorers import KeywordRelevanceScorer
+    from crawl4ai.markdown_generation_strategy import MarkdownGenerationStrategy
+
+    # Emails are scanned from cleaned HTML, so skip the HTML→markdown transform.
+    # crawl4ai substitutes its default generator for None, hence a no-op strategy.
+    class _NoMarkdown(MarkdownGenerationStrategy):
+        def generate_markdown(self, input_html: str, *args, **kwargs) -> MarkdownGenerationResult:
+            return MarkdownGenerationResult(
+                raw_markdown="", markdown_with_citations="", references_markdown="",
+            )
 
     # Prioritize pages likely to contain contact info (matches URL filter intent)
     keyword_scorer = KeywordRelevanceScorer(
@@ -87,9 +210,10 @@ async def crawl_and_extract(
         weight=0.7,
     )
 
-    crawler_config = CrawlerRunConfig(
+    return CrawlerRunConfig(
         cache_mode=CacheMode.BYPASS,
         page_timeout=15_000,
+        markdown_generator=_NoMarkdown(),
         deep_crawl_strategy=BestFirstCrawlingStrategy(
             max_depth=max_depth,
             include_external=False,
@@ -101,44 +225,233 @@ async def crawl_and_extract(
         ),
     )
 
-    browser_config = BrowserConfig(headless=True, verbose=verbose)
+
+async def _crawl_one(crawler, url: str, crawler_config) -> list:
+    """Deep-crawl one seed URL and return its pages as a flat list."""
+    pages = await crawler.arun(url=url, config=crawler_config)
+    return pages if isinstance(pages, list) else [pages]
+
+
+def _extract_from_pages(
+    pages: list,
+    max_emails_per_page: int | None = None,
+) -> dict[str, dict[str, list[str]]]:
+    """Extract emails from crawl results. Returns {domain: {email: [paths]}}."""
+    by_domain: defaultdict[str, defaultdict[str, set[str]]] = defaultdict(lambda: defaultdict(set))
+
+    for result in pages:
+        if not result.success:
+            continue
+        parsed = urlparse(result.url)
+        domain = normalize_domain(parsed.netloc or "")
+        # Interned so the same path shared across domains/pages is one object
+        path = sys.intern(parsed.path or "/")
+        # Visible text and mailto: hrefs both survive in the cleaned HTML. Raw HTML
+        # (scripts, srcset, data-*) is only a fallback when cleaning did not run.
+        text = result.cleaned_html
+        if text is None:
+            text = result.html or ""
+        _accumulate(text, path, by_domain[domain], max_emails_per_page)
+
+    return {domain: _finalize(emails) for domain, emails in by_domain.items()}
+
+
+async def crawl_and_extract(
+    urls: list[str],
+    url_patterns: list[str],
+    max_depth: int,
+    max_pages: int,
+    max_concurrency: int,
+    verbose: bool,
+    max_emails_per_page: int | None = None,
+) -> dict[str, dict[str, list[str]]]:
+    """Crawl URLs locally via crawl4ai and extract emails. Returns {domain: {email: [paths]}}."""
+    from crawl4ai import AsyncWebCrawler
+
+    browser_config = _build_browser_config(verbose)
     all_pages: list = []
+    # Seeds have independent network/render latency; cap open browser contexts
+    sem = asyncio.Semaphore(max(1, max_concurrency))
 
     async with AsyncWebCrawler(config=browser_config) as crawler:
-        for url in urls:
-            pages = await crawler.arun(url=url, config=crawler_config)
-            items = pages if isinstance(pages, list) else [pages]
-            all_pages.extend(items)
+        async def _one(url: str) -> list:
+            # Concurrent seeds must not share one strategy's page counter/cancel event
+            crawler_config = _build_run_config(url_patterns, max_depth, max_pages)
+            async with sem:
+                return await _crawl_one(crawler, url, crawler_config)
 
-    results = all_pages
+        for items in await asyncio.gather(*[_one(url) for url in urls]):
+            all_pages.extend(items)
 
-    if not results:
+    if not all_pages:
         return {}
 
-    pages = results if isinstance(results, list) else [results]
-    by_domain: dict[str, dict[str, set[str]]] = {}
+    return _extract_from_pages(all_pages, max_emails_per_page)
 
-    for result in pages:
-        if result.success and result.markdown:
-            parsed = urlparse(result.url)
-            domain = normalize_domain(parsed.netloc or "")
-            path = parsed.path or "/"
-            text = (
-                result.markdown.raw_markdown
-                if hasattr(result.markdown, "raw_markdown")
-                else str(result.markdown)
-            )
-            by_domain.setdefault(domain, {})
-            for email in EMAIL_REGEX.findall(text):
-                key = email.lower()
-                by_domain[domain].setdefault(key, set()).add(path)
 
+def _feed_stdin(loop: asyncio.AbstractEventLoop, queue: asyncio.Queue) -> None:
+    """Push stdin lines onto queue from a daemon thread; "" marks EOF."""
+    for line in iter(sys.stdin.readline, ""):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, line)
+        except RuntimeError:  # loop already closed (e.g. after Ctrl-C)
+            return
+    try:
+        loop.call_soon_threadsafe(queue.put_nowait, "")
+    except RuntimeError:
+        pass
+
+
+async def run_server(
+    url_patterns: list[str],
+    max_depth: int,
+    max_pages: int,
+    verbose: bool,
+    as_json: bool,
+    quiet: bool,
+    max_emails_per_page: int | None = None,
+) -> None:
+    """Read URLs from stdin (one per line) and crawl each with a single long-lived browser."""
+    from crawl4ai import AsyncWebCrawler
+
+    browser_config = _build_browser_config(verbose)
+    # A daemon thread rather than the default executor: asyncio.run waits for
+    # executor threads on shutdown, so a blocked readline would survive Ctrl-C
+    lines: asyncio.Queue[str] = asyncio.Queue()
+    threading.Thread(
+        target=_feed_stdin, args=(asyncio.get_running_loop(), lines), daemon=True,
+    ).start()
+
+    async with AsyncWebCrawler(config=browser_config) as crawler:
+        while True:
+            line = await lines.get()
+            if not line:
+                break
+            url = line.strip()
+            if not url:
+                continue
+            seed = ensure_scheme(url)
+            try:
+                # Only the browser is reused; the deep-crawl page budget is per URL
+                crawler_config = _build_run_config(url_patterns, max_depth, max_pages)
+                pages = await _crawl_one(crawler, seed, crawler_config)
+            except Exception as e:
+                print(f"Crawl failed for {url}: {e}", file=sys.stderr, flush=True)
+                # Keep one record per input line so consumers can pair them up
+                if as_json:
+                    print(_dumps_line({"url": url, "error": str(e)}), flush=True)
+                else:
+                    print(f"# {url}\nCrawl failed: {e}\n", flush=True)
+                continue
+            email_sources = _extract_from_pages(pages, max_emails_per_page)
+            if as_json:
+                # NDJSON: one compact record per input URL
+                sys.stdout.write(_dumps_line({"url": url, **_results_payload(email_sources)}))
+                sys.stdout.write("\n")
+            else:
+                # "# <url>" header, the usual report, then a blank separator line
+                sys.stdout.write(f"# {url}\n")
+                write_results(email_sources, as_json, quiet, sys.stdout)
+                sys.stdout.write("\n\n")
+            sys.stdout.flush()
+
+
+def _iter_text_lines(
+    email_sources: dict[str, dict[str, list[str]]],
+    quiet: bool,
+):
+    """Yield human-readable output lines for domain-grouped results."""
+    if not quiet:
+        total_emails = sum(len(emails) for emails in email_sources.values())
+        yield f"Found {total_emails} unique email(s) across {len(email_sources)} domain(s)"
+        yield ""
+    for domain in sorted(email_sources):
+        emails = email_sources[domain]
+        yield f"## {domain}"
+        yield ""
+        for email in sorted(emails):
+            # Paths arrive sorted from _finalize
+            paths = emails[email]
+            yield f"  • {email}"
+            if paths and (len(paths) > 1 or paths[0] != "/"):
+                yield f"    Found on: {', '.join(paths)}"
+        yield ""
+
+
+def _dumps(obj) -> str:
+    """Serialize obj as 2-space-indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_line(obj) -> str:
+    """Serialize obj as compact single-line JSON (one NDJSON record)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _results_payload(email_sources: dict[str, dict[str, list[str]]]) -> dict:
+    """Build the JSON output structure for domain-grouped results."""
+    total_emails = sum(len(emails) for emails in email_sources.values())
+    # LLM-friendly JSON: domains with nested email→paths
     return {
-        domain: {e: sorted(paths) for e, paths in emails.items()}
-        for domain, emails in by_domain.items()
+        "summary": {
+            "domains_crawled": len(email_sources),
+            "total_unique_emails": total_emails,
+        },
+        "emails_by_domain": {
+            domain: {
+                "emails": {
+                    email: paths
+                    for email, paths in sorted(emails.items())
+                },
+                "count": len(emails),
+            }
+            for domain, emails in sorted(email_sources.items())
+        },
     }
 
 
+def write_results(
+    email_sources: dict[str, dict[str, list[str]]],
+    as_json: bool,
+    quiet: bool,
+    out: TextIO,
+) -> None:
+    """Write domain-grouped results ({domain: {email: [paths]}}) to out as text or JSON.
+
+    Text output is streamed line by line; trailing blank lines are dropped and no
+    final newline is written.
+    """
+    if as_json:
+        out.write(_dumps(_results_payload(email_sources)))
+        return
+
+    started = False
+    blank_run = 0  # blank lines held back until more content follows them
+    for line in _iter_text_lines(email_sources, quiet):
+        if not line:
+            blank_run += 1
+            continue
+        out.write("\n" * (blank_run + started))
+        out.write(line)
+        started = True
+        blank_run = 0
+
+
+def _non_negative_int(value: str) -> int:
+    """argparse type: integer >= 0."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Crawl websites locally and extract contact emails via crawl4ai."
@@ -172,12 +485,31 @@ def main() -> None:
         "--max-pages",
         type=int,
         default=25,
-        help="Max pages to crawl (default: 25)",
+        help="Max pages to crawl per URL (default: 25)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="Max seed URLs crawled concurrently (default: 8)",
+    )
+    parser.add_argument(
+        "--max-emails-per-page",
+        type=_non_negative_int,
+        default=50,
+        help="Stop scanning a crawled page after this many unique emails; further addresses "
+             "on that page are dropped. 0 scans every page in full (default: 50)",
     )
     parser.add_argument(
         "--from-file",
         metavar="FILE",
-        help="Extract emails from local markdown file (skip crawl)",
+        nargs="+",
+        help="Extract emails from local markdown file(s) (skip crawl)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Read URLs from stdin (one per line) and crawl each with one shared browser",
     )
     parser.add_argument(
         "-v", "--verbose",
@@ -186,14 +518,36 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    if args.serve and (args.urls or args.from_file or args.output):
+        parser.error("--serve reads URLs from stdin and writes to stdout; "
+                     "it cannot be combined with URLs, --from-file or -o")
+
     script_dir = Path(__file__).parent
 
     if args.from_file:
-        file_path = Path(args.from_file)
-        if not file_path.exists():
-            print(f"Error: File not found: {file_path}", file=sys.stderr)
+        file_paths = [Path(f) for f in args.from_file]
+        for file_path in file_paths:
+            if not file_path.exists():
+                print(f"Error: File not found: {file_path}", file=sys.stderr)
+                sys.exit(1)
+        email_sources = extract_from_files(file_paths)
+    elif args.serve:
+        try:
+            asyncio.run(run_server(
+                url_patterns=load_url_patterns(script_dir),
+                max_depth=args.max_depth,
+                max_pages=args.max_pages,
+                verbose=args.verbose,
+                as_json=args.json,
+                quiet=args.quiet,
+                max_emails_per_page=args.max_emails_per_page,
+            ))
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            print(f"Crawl failed: {e}", file=sys.stderr)
             sys.exit(1)
-        email_sources = extract_from_file(file_path)
+        return
     elif args.urls:
         url_patterns = load_url_patterns(script_dir)
         urls = [ensure_scheme(u) for u in args.urls]
@@ -203,59 +557,24 @@ def main() -> None:
                 url_patterns=url_patterns,
                 max_depth=args.max_depth,
                 max_pages=args.max_pages,
+                max_concurrency=args.max_concurrency,
                 verbose=args.verbose,
+                max_emails_per_page=args.max_emails_per_page,
             ))
         except Exception as e:
             print(f"Crawl failed: {e}", file=sys.stderr)
             sys.exit(1)
     else:
-        parser.error("Either provide URLs or use --from-file")
+        parser.error("Either provide URLs, use --from-file, or use --serve")
 
-    # Build domain-grouped output (email_sources: {domain: {email: [paths]}})
-    total_emails = sum(len(emails) for emails in email_sources.values())
-
-    output_lines: list[str] = []
-    if args.json:
-        # LLM-friendly JSON: domains with nested email→paths
-        output_lines.append(json.dumps({
-            "summary": {
-                "domains_crawled": len(email_sources),
-                "total_unique_emails": total_emails,
-            },
-            "emails_by_domain": {
-                domain: {
-                    "emails": {
-                        email: paths
-                        for email, paths in sorted(emails.items())
-                    },
-                    "count": len(emails),
-                }
-                for domain, emails in sorted(email_sources.items())
-            },
-        }, indent=2))
-    else:
-        if not args.quiet:
-            output_lines.append(f"Found {total_emails} unique email(s) across {len(email_sources)} domain(s)")
-            output_lines.append("")
-        for domain in sorted(email_sources):
-            emails = email_sources[domain]
-            output_lines.append(f"## {domain}")
-            output_lines.append("")
-            for email in sorted(emails):
-                paths = emails[email]
-                paths_str = ", ".join(sorted(paths)) if paths else "(page)"
-                output_lines.append(f"  • {email}")
-                if paths and (len(paths) > 1 or paths[0] != "/"):
-                    output_lines.append(f"    Found on: {paths_str}")
-            output_lines.append("")
-
-    out_text = "\n".join(output_lines).rstrip()
     if args.output:
-        Path(args.output).write_text(out_text)
+        with open(args.output, "w", buffering=1 << 16) as f:
+            write_results(email_sources, args.json, args.quiet, f)
         if not args.quiet:
             print(f"→ {args.output}", file=sys.stderr)
     else:
-        print(out_text)
+        write_results(email_sources, args.json, args.quiet, sys.stdout)
+        sys.stdout.write("\n")
 
 
 if __name__ == "__main__":
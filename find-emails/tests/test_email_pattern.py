@@ -0,0 +1,39 @@
+"""Check that the email scanner returns the same matches as the original pattern."""
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import find_emails  # noqa: E402
+
+BASELINE_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+CASES = [
+    "a@b.co1x@y.com",
+    "x@y.com.a@b.org",
+    "mail a@b.de_c@d.org",
+    "_info@example.com_ and foo@bar.com_",
+    "-sales@ex.org",
+    "a@b@c.com",
+    "Contact Info@Example.com or sales@example.co.uk.",
+    "no addresses here",
+]
+
+
+class EmailPatternTest(unittest.TestCase):
+    def test_re_path_matches_baseline(self):
+        for text in CASES:
+            with self.subTest(text=text):
+                self.assertEqual(find_emails.EMAIL_REGEX.findall(text), BASELINE_REGEX.findall(text))
+
+    def test_scanner_matches_baseline(self):
+        # Covers google-re2 too when it is installed
+        for text in CASES:
+            with self.subTest(text=text):
+                self.assertEqual(find_emails._FIND(text), BASELINE_REGEX.findall(text))
+
+
+if __name__ == "__main__":
+    unittest.main()